@@ -10,12 +10,41 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+import io
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-# Set style for professional-looking plots
-sns.set_style("whitegrid")
+# Set style for professional-looking plots. Every chart sets its own grid
+# explicitly, so use "white" rather than "whitegrid" to avoid drawing both
+sns.set_style("white")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
+# Constrained layout is solved once at draw time, so no tight_layout() calls are needed
+plt.rcParams['figure.constrained_layout.use'] = True
+
+# PNG output settings for the player charts. 150 dpi with fast zlib
+# compression keeps re-runs quick; use 300 dpi for publication-quality output
+PLAYER_VIZ_DPI = 150
+PNG_PIL_KWARGS = {"compress_level": 1, "optimize": False}
+
+ACTIVE_PLAYERS_CSV = "cleaned_csv/ACTIVE_PLAYERS_CLEANED.csv"
+
+# Text box templates for the distribution charts, filled from the stats dict
+HEIGHT_INTERPRETATION = ('Mean: {mean:.1f}" | Median: {median:.1f}" | Std: {std:.1f}"\n'
+                         'Range: {min:.0f}" to {max:.0f}" ({spread:.0f}" spread)')
+WEIGHT_INTERPRETATION = ('Mean: {mean:.1f} lbs | Median: {median:.1f} lbs | Std: {std:.1f}\n'
+                         'Range: {min:.0f} to {max:.0f} lbs')
+
+# Output file for each player chart, in render order
+PLAYER_VIZ_FILES = [
+    'visualizations/1_height_distribution.png',
+    'visualizations/2_weight_distribution.png',
+    'visualizations/3_position_distribution.png',
+    'visualizations/4_players_per_team.png',
+    'visualizations/5_height_by_position.png',
+    'visualizations/6_weight_by_position.png',
+]
 
 
 """Create visualizations directory if it doesn't exist"""
@@ -26,6 +55,7 @@ def ensure_viz_directory():
 """
 Convert height like '6-6' to total inches
 Returns None for invalid values
+create_player_visualizations calls this once per distinct height
 """
 def height_to_inches(h):
 
@@ -44,264 +74,434 @@ def height_to_inches(h):
 
 
 """
-Create comprehensive player analysis visualizations
+Bin values into a histogram in a single pass
+Returns (counts, edges); reuse them for any overlay instead of re-binning
+(e.g. np.cumsum(counts) gives a cumulative distribution)
+"""
+def bin_once(arr, bins=25):
+    counts, edges = np.histogram(arr, bins=bins)
+    return counts, edges
+
 
-Visualizations:
-1. Height distribution histogram
-2. Weight distribution histogram
-3. Position frequency bar chart
-4. Players per team bar chart
-5. Average height by position
-6. Average weight by position
 """
-def create_player_visualizations():
+Summary stats of a float array, skipping NaN without copying to a Series
+std uses ddof=1 to match pandas
+"""
+def nan_summary(arr):
+    return {"mean": np.nanmean(arr), "median": np.nanmedian(arr),
+            "std": np.nanstd(arr, ddof=1), "min": np.nanmin(arr), "max": np.nanmax(arr)}
 
-    df_players = pd.read_csv("cleaned_csv/ACTIVE_PLAYERS_CLEANED.csv")
 
-    # Convert height and weight
-    df_players["height_in"] = df_players["height"].apply(height_to_inches)
-    df_players["weight"] = pd.to_numeric(df_players["weight"], errors="coerce")
+"""
+Mean and sample std of values per group, keyed by a categorical Series
+Sorts once by category code and reduces each contiguous run with
+np.add.reduceat; NaN values are skipped like pandas mean/std
+"""
+def group_mean_std(keys, values):
+    codes = keys.cat.codes.to_numpy()
+    vals = values.to_numpy(dtype=np.float64)
 
+    # Rows with a missing key are dropped, matching groupby
+    keep = codes >= 0
+    codes, vals = codes[keep], vals[keep]
+    if len(codes) == 0:
+        return pd.DataFrame({"mean": [], "std": []}, index=keys.cat.categories[:0])
 
+    order = np.argsort(codes, kind="stable")
+    codes, vals = codes[order], vals[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
 
-    # 1. HEIGHT DISTRIBUTION
-    plt.figure(figsize=(12, 6))
-    heights = df_players["height_in"].dropna()
-    plt.hist(heights, bins=25, edgecolor='black', alpha=0.7, color='steelblue')
-    plt.axvline(heights.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {heights.mean():.1f}"')
-    plt.axvline(heights.median(), color='green', linestyle='--', linewidth=2, label=f'Median: {heights.median():.1f}"')
-    
-    
-    # Adding labels and title
-    plt.xlabel("Height (inches)", fontsize=12, fontweight='bold')
-    plt.ylabel("Number of Players", fontsize=12, fontweight='bold')
-    plt.title("Distribution of NBA Player Heights\n(Approximately Normal with Slight Right Skew)",
-              fontsize=14, fontweight='bold', pad=20)
-    plt.legend()
-    plt.grid(axis='y', alpha=0.3)
+    valid = ~np.isnan(vals)
+    n = np.add.reduceat(valid.astype(np.int64), starts)
+    sums = np.add.reduceat(np.where(valid, vals, 0.0), starts)
 
+    # Groups with 1 value get NaN std; groups with no values are dropped below
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / n
 
-    # Add interpretation text box
-    interpretation = (f"Mean: {heights.mean():.1f}\" | Median: {heights.median():.1f}\" | Std: {heights.std():.1f}\"\n"
-                     f"Range: {heights.min():.0f}\" to {heights.max():.0f}\" ({heights.max()-heights.min():.0f}\" spread)")
-    
-    
-    
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-             verticalalignment='top', fontsize=10, family='monospace')
+        # Sum squared deviations from each group's mean (numerically stable,
+        # unlike sum(x**2) - sum(x)*mean)
+        group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(vals)]))
+        deviations = np.where(valid, vals - means[group], 0.0)
+        stds = np.sqrt(np.add.reduceat(deviations ** 2, starts) / (n - 1))
 
-    plt.tight_layout()
-    
-    
-    # saving the figure
-    plt.savefig('visualizations/1_height_distribution.png', dpi=300, bbox_inches='tight')
-    print("Saved: visualizations/1_height_distribution.png")
-    plt.close()
+    # Positions whose values are all NaN are dropped, like dropna() before groupby
+    has_values = n > 0
+    index = pd.Index(keys.cat.categories[codes[starts][has_values]], name=keys.name)
+    return pd.DataFrame({"mean": means[has_values], "std": stds[has_values]}, index=index)
+
+
+"""
+List the player chart files that need to be (re)generated: missing ones,
+or ones not newer than both the active players CSV and this module (so
+editing the rendering code also marks them stale). force=True lists all
+"""
+def stale_player_visualizations(force=False):
+    if force:
+        return list(PLAYER_VIZ_FILES)
 
+    src_mtime = max(os.path.getmtime(ACTIVE_PLAYERS_CSV), os.path.getmtime(__file__))
+    return [path for path in PLAYER_VIZ_FILES
+            if not (os.path.exists(path) and os.path.getmtime(path) > src_mtime)]
 
 
+"""
+Load the cleaned active players CSV
+Only the columns used by the player visualizations are parsed
+Weight is parsed as float32 directly; if the column holds other
+non-numeric tokens, it is re-read as text and coerced (those become NaN)
+"""
+def load_active_players():
+    columns = ["position", "height", "weight", "team.full_name"]
+    category_dtypes = {"position": "category", "team.full_name": "category"}
+    na_values = ["", "NA", "-"]
 
+    try:
+        df_players = pd.read_csv(ACTIVE_PLAYERS_CSV, usecols=columns, na_values=na_values,
+                                 dtype=dict(category_dtypes, weight="float32"))
+    except ValueError as err:
+        # Only a non-numeric weight token is recoverable; other errors
+        # (e.g. a missing column) would fail the same way on a re-read
+        if "could not convert string to float" not in str(err):
+            raise
+        # Read weight as text and coerce the bad tokens to NaN
+        df_players = pd.read_csv(ACTIVE_PLAYERS_CSV, usecols=columns, na_values=na_values,
+                                 dtype=category_dtypes)
+        df_players["weight"] = pd.to_numeric(df_players["weight"], errors="coerce", downcast="float")
+    return df_players
 
 
+"""
+Write data to path atomically: write a temp file next to it, then rename
+"""
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    print(f"Saved: {path}")
 
 
+# Figure/Axes reused by every player chart rendered in this process
+_player_fig = None
+_player_ax = None
 
-    # 2. WEIGHT DISTRIBUTION
-    plt.figure(figsize=(12, 6))
-    weights = df_players["weight"].dropna()
-    plt.hist(weights, bins=25, edgecolor='black', alpha=0.7, color='coral')
-    plt.axvline(weights.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {weights.mean():.1f} lbs')
-    plt.axvline(weights.median(), color='green', linestyle='--', linewidth=2, label=f'Median: {weights.median():.1f} lbs')
+
+"""
+Return this process's shared Figure and Axes for the player charts,
+cleared and resized to figsize (created on first use)
+"""
+def _shared_figure(figsize):
+    global _player_fig, _player_ax
+
+    if _player_fig is None:
+        _player_fig, _player_ax = plt.subplots(figsize=figsize)
+    else:
+        _player_ax.clear()
+        _player_fig.set_size_inches(figsize)
+    return _player_fig, _player_ax
+
+
+"""
+Render fig to PNG bytes in memory using the player chart output settings
+"""
+def _png_bytes(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=PLAYER_VIZ_DPI, bbox_inches='tight',
+                pil_kwargs=PNG_PIL_KWARGS)
+    return buf.getvalue()
+
+
+"""
+1. Height distribution histogram (drawn from pre-computed bins)
+"""
+def _plot_height_distribution(height_bins, height_stats):
+
+    fig, ax = _shared_figure(figsize=(12, 6))
+    counts, edges = height_bins
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           edgecolor='black', alpha=0.7, color='steelblue')
+    ax.axvline(height_stats['mean'], color='red', linestyle='--', linewidth=2, label=f'Mean: {height_stats["mean"]:.1f}"')
+    ax.axvline(height_stats['median'], color='green', linestyle='--', linewidth=2, label=f'Median: {height_stats["median"]:.1f}"')
     
     
     # Adding labels and title
-    plt.xlabel("Weight (lbs)", fontsize=12, fontweight='bold')
-    plt.ylabel("Number of Players", fontsize=12, fontweight='bold')
-    plt.title("Distribution of NBA Player Weights\n(Bell-Shaped with Some Heavier Outliers)",
-              fontsize=14, fontweight='bold', pad=20)
-    plt.legend()
-    plt.grid(axis='y', alpha=0.3)
-
+    ax.set_xlabel("Height (inches)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Number of Players", fontsize=12, fontweight='bold')
+    ax.set_title("Distribution of NBA Player Heights\n(Approximately Normal with Slight Right Skew)",
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3)
 
 
     # Add interpretation text box
-    interpretation = (f"Mean: {weights.mean():.1f} lbs | Median: {weights.median():.1f} lbs | Std: {weights.std():.1f}\n"
-                     f"Range: {weights.min():.0f} to {weights.max():.0f} lbs")
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-             verticalalignment='top', fontsize=10, family='monospace')
-
-    plt.tight_layout()
+    interpretation = HEIGHT_INTERPRETATION.format_map(
+        dict(height_stats, spread=height_stats['max'] - height_stats['min']))
     
     
     
-    # saving the figure
-    plt.savefig('visualizations/2_weight_distribution.png', dpi=300, bbox_inches='tight')
-    print("Saved: visualizations/2_weight_distribution.png")
-    plt.close()
+    ax.text(0.02, 0.98, interpretation, transform=ax.transAxes,
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+            verticalalignment='top', fontsize=10, family='monospace')
 
+    
+    
+    # rendering the figure to memory; the parent process writes the file
+    return _png_bytes(fig)
 
 
+"""
+2. Weight distribution histogram (drawn from pre-computed bins)
+"""
+def _plot_weight_distribution(weight_bins, weight_stats):
 
+    fig, ax = _shared_figure(figsize=(12, 6))
+    counts, edges = weight_bins
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           edgecolor='black', alpha=0.7, color='coral')
+    ax.axvline(weight_stats['mean'], color='red', linestyle='--', linewidth=2, label=f'Mean: {weight_stats["mean"]:.1f} lbs')
+    ax.axvline(weight_stats['median'], color='green', linestyle='--', linewidth=2, label=f'Median: {weight_stats["median"]:.1f} lbs')
+    
+    
+    # Adding labels and title
+    ax.set_xlabel("Weight (lbs)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Number of Players", fontsize=12, fontweight='bold')
+    ax.set_title("Distribution of NBA Player Weights\n(Bell-Shaped with Some Heavier Outliers)",
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3)
 
 
 
+    # Add interpretation text box
+    interpretation = WEIGHT_INTERPRETATION.format_map(weight_stats)
+    ax.text(0.02, 0.98, interpretation, transform=ax.transAxes,
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+            verticalalignment='top', fontsize=10, family='monospace')
+
+    
+    
+    
+    # rendering the figure to memory; the parent process writes the file
+    return _png_bytes(fig)
+
+
+"""
+3. Position frequency bar chart
+"""
+def _plot_position_distribution(position_counts):
 
-    # 3. POSITION FREQUENCY
-    plt.figure(figsize=(10, 6))
-    position_counts = df_players["position"].value_counts().sort_values(ascending=False)
+    fig, ax = _shared_figure(figsize=(10, 6))
     colors = sns.color_palette("husl", len(position_counts))
     
     
     # Create bar chart
-    bars = plt.bar(position_counts.index, position_counts.values, color=colors, edgecolor='black')
+    bars = ax.bar(position_counts.index, position_counts.values, color=colors, edgecolor='black')
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}',
-                ha='center', va='bottom', fontweight='bold')
+    ax.bar_label(bars, fmt='%d', padding=3, fontweight='bold')
 
 
     # Adding labels and title
-    plt.xlabel("Position", fontsize=12, fontweight='bold')
-    plt.ylabel("Number of Players", fontsize=12, fontweight='bold')
-    plt.title("Active NBA Players by Position\n(Relatively Balanced Distribution Across Positions)",
-              fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlabel("Position", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Number of Players", fontsize=12, fontweight='bold')
+    ax.set_title("Active NBA Players by Position\n(Relatively Balanced Distribution Across Positions)",
+                 fontsize=14, fontweight='bold', pad=20)
     
-    plt.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
+    ax.grid(axis='y', alpha=0.3)
     
     
     
-    # saving the figure
-    plt.savefig('visualizations/3_position_distribution.png', dpi=300, bbox_inches='tight')
-    print("Saved: visualizations/3_position_distribution.png")
-    plt.close()
+    # rendering the figure to memory; the parent process writes the file
+    return _png_bytes(fig)
 
 
+"""
+4. Players per team bar chart
+"""
+def _plot_players_per_team(team_counts):
 
-    # 4. PLAYERS PER TEAM
-    plt.figure(figsize=(14, 7))
-    team_counts = df_players["team.full_name"].value_counts().sort_values(ascending=False)
-    plt.bar(range(len(team_counts)), team_counts.values, color='teal', edgecolor='black', alpha=0.7)
+    fig, ax = _shared_figure(figsize=(14, 7))
+    ax.bar(range(len(team_counts)), team_counts.values, color='teal', edgecolor='black', alpha=0.7)
     
     
     
     # the labels and title
-    plt.xlabel("Teams (sorted by player count)", fontsize=12, fontweight='bold')
-    plt.ylabel("Number of Players", fontsize=12, fontweight='bold')
-    plt.title("Active Players per Team\n(Most Teams Maintain ~13-17 Player Rosters)",
-              fontsize=14, fontweight='bold', pad=20)
-    plt.axhline(team_counts.mean(), color='red', linestyle='--', linewidth=2,
-                label=f'Average: {team_counts.mean():.1f} players')
-    plt.legend()
-    plt.grid(axis='y', alpha=0.3)
+    ax.set_xlabel("Teams (sorted by player count)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Number of Players", fontsize=12, fontweight='bold')
+    ax.set_title("Active Players per Team\n(Most Teams Maintain ~13-17 Player Rosters)",
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.axhline(team_counts.mean(), color='red', linestyle='--', linewidth=2,
+               label=f'Average: {team_counts.mean():.1f} players')
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3)
     
     # Hide x-tick labels for clarity
-    plt.xticks([])  
-    plt.tight_layout()
+    ax.set_xticks([])  
     
     
     
-    # saving the figure
-    plt.savefig('visualizations/4_players_per_team.png', dpi=300, bbox_inches='tight')
-    print("Saved: visualizations/4_players_per_team.png")
-    plt.close()
+    # rendering the figure to memory; the parent process writes the file
+    return _png_bytes(fig)
 
 
+"""
+5. Average height by position (sorted, std filled for single-player positions)
+"""
+def _plot_height_by_position(height_by_pos):
 
-    # 5. AVERAGE HEIGHT BY POSITION
-    plt.figure(figsize=(10, 6))
-    height_by_pos = (df_players.dropna(subset=['height_in'])
-                     .groupby('position')['height_in']
-                     .agg(['mean', 'std']))
-    height_by_pos = height_by_pos.sort_values('mean', ascending=False)
-
-    # Replace NaN std with 0 for positions with only 1 player
-    height_by_pos['std'] = height_by_pos['std'].fillna(0)
+    fig, ax = _shared_figure(figsize=(10, 6))
 
 
     # Create bar chart with error bars
-    bars = plt.bar(height_by_pos.index, height_by_pos['mean'],
-                   yerr=height_by_pos['std'], capsize=5,
-                   color='skyblue', edgecolor='black', alpha=0.8)
+    bars = ax.bar(height_by_pos.index, height_by_pos['mean'],
+                  yerr=height_by_pos['std'], capsize=5,
+                  color='skyblue', edgecolor='black', alpha=0.8)
 
-    # Add value labels
-    for i, (pos, row) in enumerate(height_by_pos.iterrows()):
-        # For positions with std=0 (only 1 player), use fixed offset; otherwise use std + offset
-        if row['std'] == 0:
-            y_position = row['mean'] + 2.0  # Fixed offset for single-player positions
-        else:
-            y_position = row['mean'] + row['std'] + 0.5
-        plt.text(i, y_position, f"{row['mean']:.1f}\"",
-                ha='center', fontweight='bold')
+    # Add value labels (bar_label places them above the error bar caps)
+    ax.bar_label(bars, labels=[f"{m:.1f}\"" for m in height_by_pos['mean']],
+                 padding=3, fontweight='bold')
 
 
 
     # titles and labels
-    plt.xlabel("Position", fontsize=12, fontweight='bold')
-    plt.ylabel("Average Height (inches)", fontsize=12, fontweight='bold')
-    plt.title("Average Height by Position with Standard Deviation\n(Clear Hierarchical Pattern: Centers Tallest, Guards Shortest)",
-              fontsize=14, fontweight='bold', pad=20)
-    plt.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
+    ax.set_xlabel("Position", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Average Height (inches)", fontsize=12, fontweight='bold')
+    ax.set_title("Average Height by Position with Standard Deviation\n(Clear Hierarchical Pattern: Centers Tallest, Guards Shortest)",
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.grid(axis='y', alpha=0.3)
     
     
-    # saving the figure
-    plt.savefig('visualizations/5_height_by_position.png', dpi=300, bbox_inches='tight')
-    print("Saved: visualizations/5_height_by_position.png")
-    plt.close()
+    # rendering the figure to memory; the parent process writes the file
+    return _png_bytes(fig)
 
 
+"""
+6. Average weight by position (sorted, std filled for single-player positions)
+"""
+def _plot_weight_by_position(weight_by_pos):
 
-    # 6. AVERAGE WEIGHT BY POSITION
-    plt.figure(figsize=(10, 6))
-    
-    
-    # Calculate average weight and std dev by position
-    weight_by_pos = (df_players.dropna(subset=['weight']).groupby('position')['weight'].agg(['mean', 'std']))
-    
-    
-    # Sort by mean weight
-    weight_by_pos = weight_by_pos.sort_values('mean', ascending=False)
-
-    # Replace NaN std with 0 for positions with only 1 player
-    weight_by_pos['std'] = weight_by_pos['std'].fillna(0)
+    fig, ax = _shared_figure(figsize=(10, 6))
 
 
 
     # Create bar chart with error bars
-    bars = plt.bar(weight_by_pos.index, weight_by_pos['mean'], yerr=weight_by_pos['std'], capsize=5, color='salmon', 
-                   edgecolor='black', alpha=0.8)
+    bars = ax.bar(weight_by_pos.index, weight_by_pos['mean'], yerr=weight_by_pos['std'], capsize=5, color='salmon', 
+                  edgecolor='black', alpha=0.8)
 
-    # Add value labels
-    for i, (pos, row) in enumerate(weight_by_pos.iterrows()):
-        # For positions with std=0 (only 1 player), use fixed offset; otherwise use std + offset
-        if row['std'] == 0:
-            y_position = row['mean'] + 10  # Fixed offset for single-player positions
-        else:
-            y_position = row['mean'] + row['std'] + 2
-        plt.text(i, y_position, f"{row['mean']:.0f} lbs",
-                ha='center', fontweight='bold')
+    # Add value labels (bar_label places them above the error bar caps)
+    ax.bar_label(bars, labels=[f"{m:.0f} lbs" for m in weight_by_pos['mean']],
+                 padding=3, fontweight='bold')
 
 
     # titles and labels
-    plt.xlabel("Position", fontsize=12, fontweight='bold')
-    plt.ylabel("Average Weight (lbs)", fontsize=12, fontweight='bold')
-    plt.title("Average Weight by Position with Standard Deviation\n(Weight Correlates with Position Requirements)",
-              fontsize=14, fontweight='bold', pad=20)
-    plt.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
+    ax.set_xlabel("Position", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Average Weight (lbs)", fontsize=12, fontweight='bold')
+    ax.set_title("Average Weight by Position with Standard Deviation\n(Weight Correlates with Position Requirements)",
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.grid(axis='y', alpha=0.3)
     
     
     
-    # saving the figure
-    plt.savefig('visualizations/6_weight_by_position.png', dpi=300, bbox_inches='tight')
-    print("Saved: visualizations/6_weight_by_position.png")
-    plt.close()
+    # rendering the figure to memory; the parent process writes the file
+    return _png_bytes(fig)
+
+
+"""
+Create comprehensive player analysis visualizations
+
+Visualizations:
+1. Height distribution histogram
+2. Weight distribution histogram
+3. Position frequency bar chart
+4. Players per team bar chart
+5. Average height by position
+6. Average weight by position
+
+When df_players is None the CSV is loaded here, and charts newer than both
+the CSV and this module are skipped unless force=True. A caller-supplied
+df_players always renders every chart
+"""
+def create_player_visualizations(df_players=None, force=False):
+
+    if df_players is None:
+        stale = stale_player_visualizations(force)
+        if not stale:
+            print("Player visualizations are up to date, skipping.")
+            return
+        df_players = load_active_players()
+    else:
+        stale = list(PLAYER_VIZ_FILES)
+        # Columns are converted and added below; leave the caller's frame untouched
+        df_players = df_players.copy()
+
+    # Low-cardinality columns used for grouping/counting; categorical codes
+    # are much cheaper to hash than strings (no-op if already categorical).
+    # Unused categories are dropped so value_counts() doesn't report zero-row
+    # positions/teams for a filtered frame
+    df_players["position"] = df_players["position"].astype("category").cat.remove_unused_categories()
+    df_players["team.full_name"] = df_players["team.full_name"].astype("category").cat.remove_unused_categories()
+
+    # Convert height and weight
+    # Heights only take a few dozen distinct values, so parse each one once
+    # and map the results back onto the column (invalid values become NaN)
+    unique_heights = df_players["height"].dropna().unique()
+    inches_by_height = {h: height_to_inches(h) for h in unique_heights}
+    df_players["height_in"] = df_players["height"].map(inches_by_height).astype("float32")
+    # load_active_players() already parses weight as float32; only convert
+    # frames whose weight column was read some other way
+    if not pd.api.types.is_float_dtype(df_players["weight"]):
+        df_players["weight"] = pd.to_numeric(df_players["weight"], errors="coerce", downcast="float")
+
+
+
+    # Inputs for each chart, computed once up front
+    # Work on the raw float arrays with NaN-aware reductions instead of
+    # materializing dropna() copies of each column
+    heights = df_players["height_in"].to_numpy()
+    weights = df_players["weight"].to_numpy()
+    height_bins = bin_once(heights[~np.isnan(heights)])
+    weight_bins = bin_once(weights[~np.isnan(weights)])
+    height_stats = nan_summary(heights)
+    weight_stats = nan_summary(weights)
+    position_counts = df_players["position"].value_counts()
+    team_counts = df_players["team.full_name"].value_counts()
+
+    # Average height and weight by position
+    height_by_pos = group_mean_std(df_players["position"], df_players["height_in"])
+    weight_by_pos = group_mean_std(df_players["position"], df_players["weight"])
+
+    # Sort by mean and replace NaN std with 0 for positions with only 1 player
+    height_by_pos = height_by_pos.sort_values('mean', ascending=False)
+    height_by_pos['std'] = height_by_pos['std'].fillna(0)
+
+    weight_by_pos = weight_by_pos.sort_values('mean', ascending=False)
+    weight_by_pos['std'] = weight_by_pos['std'].fillna(0)
+
+
+
+    # The six charts are independent, so render them in parallel.
+    # Separate processes are used because matplotlib's Agg backend is not thread-safe;
+    # a worker that renders several charts reuses one Figure for all of them.
+    # Workers return encoded PNG bytes, and a small thread pool writes each file
+    # as soon as it arrives so disk I/O overlaps with the remaining renders
+    with ProcessPoolExecutor(max_workers=min(6, os.cpu_count() or 1)) as executor, \
+            ThreadPoolExecutor(max_workers=2) as writer:
+        jobs = dict(zip(PLAYER_VIZ_FILES, [
+            (_plot_height_distribution, height_bins, height_stats),
+            (_plot_weight_distribution, weight_bins, weight_stats),
+            (_plot_position_distribution, position_counts),
+            (_plot_players_per_team, team_counts),
+            (_plot_height_by_position, height_by_pos),
+            (_plot_weight_by_position, weight_by_pos),
+        ]))
+
+        # Only render the charts that are missing or out of date
+        futures = {executor.submit(*jobs[path]): path for path in stale}
+        writes = [writer.submit(_write_atomic, futures[future], future.result())
+                  for future in as_completed(futures)]
+        for write in writes:
+            write.result()
 
     
 
@@ -323,6 +523,7 @@ def create_team_performance_visualizations():
 
     # 7. OFFENSIVE RATING VS WINS
     plt.figure(figsize=(12, 7))
+    ax = plt.gca()
     correlation = df['OFF_RATING'].corr(df['W'])
 
     plt.scatter(df["OFF_RATING"], df["W"], s=100, alpha=0.6, c=df['W'],
@@ -346,11 +547,10 @@ def create_team_performance_visualizations():
 
     # Add interpretation text box
     interpretation = f"Correlation: r={correlation:.3f}\nHigher offensive ratings strongly predict more wins."
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
+    plt.text(0.02, 0.98, interpretation, transform=ax.transAxes,
              bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8),
              verticalalignment='top', fontsize=11, family='monospace')
 
-    plt.tight_layout()
     plt.savefig('visualizations/7_offense_vs_wins.png', dpi=300, bbox_inches='tight')
     print("✓ Saved: visualizations/7_offense_vs_wins.png")
     plt.close()
@@ -359,6 +559,7 @@ def create_team_performance_visualizations():
 
     # 8. DEFENSIVE RATING VS WINS
     plt.figure(figsize=(12, 7))
+    ax = plt.gca()
     correlation = df['DEF_RATING'].corr(df['W'])
 
     plt.scatter(df["DEF_RATING"], df["W"], s=100, alpha=0.6, c=df['W'],
@@ -381,12 +582,11 @@ def create_team_performance_visualizations():
 
     # Add interpretation text box
     interpretation = f"Correlation: r={correlation:.3f}\nLower defensive ratings (better defense) strongly predict more wins."
-    plt.text(0.98, 0.02, interpretation, transform=plt.gca().transAxes,
+    plt.text(0.98, 0.02, interpretation, transform=ax.transAxes,
              bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8),
              verticalalignment='bottom', horizontalalignment='right',
              fontsize=11, family='monospace')
 
-    plt.tight_layout()
     plt.savefig('visualizations/8_defense_vs_wins.png', dpi=300, bbox_inches='tight')
     print("✓ Saved: visualizations/8_defense_vs_wins.png")
     plt.close()
@@ -395,6 +595,7 @@ def create_team_performance_visualizations():
 
     # 9. NET RATING VS WIN PERCENTAGE
     plt.figure(figsize=(12, 7))
+    ax = plt.gca()
     correlation = df['NET_RATING'].corr(df['WIN_PCT'])
 
     plt.scatter(df["NET_RATING"], df["WIN_PCT"], s=120, alpha=0.7, c=df['W'],
@@ -419,11 +620,10 @@ def create_team_performance_visualizations():
 
     # Add interpretation text box
     interpretation = f"Correlation: r={correlation:.3f}\nNet Rating is the single best predictor of team success!"
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
+    plt.text(0.02, 0.98, interpretation, transform=ax.transAxes,
              bbox=dict(boxstyle='round', facecolor='gold', alpha=0.9),
              verticalalignment='top', fontsize=12, family='monospace', fontweight='bold')
 
-    plt.tight_layout()
     plt.savefig('visualizations/9_net_rating_vs_win_pct.png', dpi=300, bbox_inches='tight')
     print("✓ Saved: visualizations/9_net_rating_vs_win_pct.png")
     plt.close()
@@ -450,7 +650,6 @@ def create_team_performance_visualizations():
     plt.xticks(rotation=90, ha='right')
     plt.legend()
     plt.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
     
     
     # saving the figure
@@ -480,6 +679,7 @@ def create_jokic_visualizations():
 
     # 11. POINTS PROGRESSION
     plt.figure(figsize=(12, 6))
+    ax = plt.gca()
     plt.plot(df["SEASON"], df["PTS"], marker="o", linewidth=3, markersize=8, color='red')
     plt.fill_between(df["SEASON"], df["PTS"], alpha=0.3, color='red')
     
@@ -494,11 +694,10 @@ def create_jokic_visualizations():
 
     # Add interpretation text box
     interpretation = f"Career Average: {df['PTS'].mean():.0f} points/season\nPeak: {df['PTS'].max():.0f} points ({df.loc[df['PTS'].idxmax(), 'SEASON']:.0f})"
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
+    plt.text(0.02, 0.98, interpretation, transform=ax.transAxes,
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
              verticalalignment='top', fontsize=11, family='monospace')
 
-    plt.tight_layout()
     
     
     # saving the figure
@@ -510,6 +709,7 @@ def create_jokic_visualizations():
 
     # 12. REBOUNDS PROGRESSION
     plt.figure(figsize=(12, 6))
+    ax = plt.gca()
     plt.plot(df["SEASON"], df["REB"], marker="s", linewidth=3, markersize=8, color='blue')
     plt.fill_between(df["SEASON"], df["REB"], alpha=0.3, color='blue')
     
@@ -524,11 +724,10 @@ def create_jokic_visualizations():
 
     # Add interpretation text box
     interpretation = f"Career Average: {df['REB'].mean():.0f} rebounds/season\nPeak: {df['REB'].max():.0f} rebounds ({df.loc[df['REB'].idxmax(), 'SEASON']:.0f})"
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
+    plt.text(0.02, 0.98, interpretation, transform=ax.transAxes,
              bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8),
              verticalalignment='top', fontsize=11, family='monospace')
 
-    plt.tight_layout()
     
     
     # saving the figure
@@ -540,6 +739,7 @@ def create_jokic_visualizations():
 
     # 13. ASSISTS PROGRESSION
     plt.figure(figsize=(12, 6))
+    ax = plt.gca()
     plt.plot(df["SEASON"], df["AST"], marker="^", linewidth=3, markersize=8, color='green')
     plt.fill_between(df["SEASON"], df["AST"], alpha=0.3, color='green')
     
@@ -554,11 +754,10 @@ def create_jokic_visualizations():
 
     # Add interpretation text box
     interpretation = f"Career Average: {df['AST'].mean():.0f} assists/season\nPeak: {df['AST'].max():.0f} assists ({df.loc[df['AST'].idxmax(), 'SEASON']:.0f})\nRare for a center!"
-    plt.text(0.02, 0.98, interpretation, transform=plt.gca().transAxes,
+    plt.text(0.02, 0.98, interpretation, transform=ax.transAxes,
              bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8),
              verticalalignment='top', fontsize=11, family='monospace')
 
-    plt.tight_layout()
     
     # saving the figure
     plt.savefig('visualizations/13_jokic_assists.png', dpi=300, bbox_inches='tight')
@@ -566,11 +765,16 @@ def create_jokic_visualizations():
     plt.close()
 
 
-def main():
-    """Generate all enhanced visualizations"""
+def main(force=False):
+    """Generate all enhanced visualizations
+
+    Player charts newer than both the players CSV and this module are
+    skipped; pass force=True (or run with --force) to regenerate them anyway
+    """
     ensure_viz_directory()
 
-    create_player_visualizations()
+    # Loads the players CSV itself, and only if some player chart is stale
+    create_player_visualizations(force=force)
     create_team_performance_visualizations()
     create_jokic_visualizations()
 
@@ -578,4 +782,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(force="--force" in sys.argv[1:])